@@ -0,0 +1,16 @@
+"""
+Celery application for the backtester project.
+
+Tasks are discovered from each installed app's ``tasks.py`` and configured
+through the ``CELERY_*`` entries in Django settings.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backtester.settings')
+
+app = Celery('backtester')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
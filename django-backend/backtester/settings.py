@@ -74,12 +74,83 @@ WSGI_APPLICATION = 'backtester.wsgi.application'
 # --- Database ---
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db_data' / 'db.sqlite3',
+# PostgreSQL behind a connection pool when configured, SQLite for local dev
+POSTGRES_HOST = os.environ.get('POSTGRES_HOST')
+
+if POSTGRES_HOST:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'dj_db_conn_pool.backends.postgresql',
+            'NAME': os.environ.get('POSTGRES_DB', 'backtester'),
+            'USER': os.environ.get('POSTGRES_USER', 'backtester'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': POSTGRES_HOST,
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            # The pool owns connection lifetime
+            'CONN_MAX_AGE': 0,
+            'POOL_OPTIONS': {
+                'POOL_SIZE': int(os.environ.get('DJANGO_DB_POOL_SIZE', 20)),
+                'MAX_OVERFLOW': int(os.environ.get('DJANGO_DB_MAX_OVERFLOW', 10)),
+                'RECYCLE': 300,
+            },
+        }
     }
-}
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db_data' / 'db.sqlite3',
+        }
+    }
+
+
+# --- Cache ---
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    # On disk, so entries are shared by every worker process and survive restarts
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': BASE_DIR / '.cache',
+        }
+    }
+
+# Seconds to keep downloaded OHLCV data (daily and intraday intervals)
+OHLCV_CACHE_TTL = int(os.environ.get('DJANGO_OHLCV_TTL', 60 * 60 * 24))
+OHLCV_INTRADAY_CACHE_TTL = int(os.environ.get('DJANGO_OHLCV_INTRADAY_TTL', 60 * 5))
+
+# Seconds a persisted run may be served again instead of re-running the backtest
+BACKTEST_RUN_CACHE_TTL = int(os.environ.get('DJANGO_BACKTEST_RUN_TTL', 60 * 60 * 24))
+
+
+# --- Celery ---
+# https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+
+CELERY_BROKER_URL = REDIS_URL
+CELERY_RESULT_BACKEND = REDIS_URL or 'cache+memory://'
+CELERY_RESULT_EXPIRES = 60 * 60
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+# Report running jobs as "started" instead of "pending"
+CELERY_TASK_TRACK_STARTED = True
+
+# Backtests run for seconds: hand each worker process one job at a time so a
+# queued request never waits behind another process's prefetched backlog
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Without a broker, run tasks inline so local dev works without a worker
+CELERY_TASK_ALWAYS_EAGER = not REDIS_URL
 
 
 # --- Password Validation ---
@@ -136,7 +207,19 @@ CSRF_TRUSTED_ORIGINS = os.environ.get('DJANGO_CSRF_TRUSTED_ORIGINS', 'http://loc
 
 # --- Django REST Framework ---
 
-# No specific settings for now, but this is where you would put them.
+REST_FRAMEWORK = {
+    # orjson for the (large) chart payloads, browsable API kept for development
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+
+# --- System Checks ---
+
+# Covering indexes only apply on PostgreSQL; SQLite builds them as plain indexes
+SILENCED_SYSTEM_CHECKS = ['models.W040']
 
 
 # --- Default primary key field type ---
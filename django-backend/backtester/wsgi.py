@@ -9,8 +9,23 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backtester.settings')
 
+
+def warm_up_eager_backtests():
+    """
+    Without a broker, backtests run inside the web worker: warm the engine up
+    front so the first request doesn't pay for strategy imports and first runs.
+    """
+    if not settings.CELERY_TASK_ALWAYS_EAGER:
+        return
+    from core.services.backtest import warm_up_backtest_engine
+
+    warm_up_backtest_engine()
+
+
 application = get_wsgi_application()
+warm_up_eager_backtests()
@@ -15,6 +15,7 @@ class BacktestRunAdmin(admin.ModelAdmin):
 class TradeAdmin(admin.ModelAdmin):
     list_display = ["run", "entry_time", "exit_time", "entry_price", "size", "pnl", "return_pct"]
     list_filter = ["run__strategy", "run__ticker"]
+    list_select_related = ["run"]
     search_fields = ["run__ticker"]
     readonly_fields = ["entry_time", "exit_time"]
 
@@ -23,4 +24,5 @@ class TradeAdmin(admin.ModelAdmin):
 class EquityPointAdmin(admin.ModelAdmin):
     list_display = ["run", "timestamp", "equity"]
     list_filter = ["run__strategy", "run__ticker"]
+    list_select_related = ["run"]
     search_fields = ["run__ticker"]
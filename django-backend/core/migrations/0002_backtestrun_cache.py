@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-14 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backtestrun',
+            name='indicators',
+            field=models.JSONField(blank=True, default=dict, help_text='price chart overlays (sma1/sma2)'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.4 on 2026-10-14 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_backtestrun_cache'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='equitypoint',
+            name='core_equity_run_id_59a9ab_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='trade',
+            name='core_trade_run_id_24a74c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='equitypoint',
+            index=models.Index(fields=['run', 'timestamp'], include=('equity',), name='equity_run_time_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='trade',
+            index=models.Index(fields=['run', 'entry_time'], include=('entry_price', 'exit_price', 'size', 'pnl', 'return_pct'), name='trade_run_time_cov'),
+        ),
+    ]
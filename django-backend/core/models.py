@@ -16,6 +16,8 @@ class BacktestRun(models.Model):
     trades = models.IntegerField()
     winrate_pct = models.FloatField()
 
+    indicators = models.JSONField(default=dict, blank=True, help_text="price chart overlays (sma1/sma2)")
+
     created_at = models.DateTimeField(auto_now_add=True, help_text="when the backtester was ran")
 
     def __str__(self):
@@ -42,7 +44,12 @@ class Trade(models.Model):
     class Meta:
         ordering = ["entry_time"]
         indexes = [
-            models.Index(fields=["run", "entry_time"]),
+            # Covering index: chart/admin reads are served without heap lookups (PostgreSQL)
+            models.Index(
+                fields=["run", "entry_time"],
+                include=["entry_price", "exit_price", "size", "pnl", "return_pct"],
+                name="trade_run_time_cov",
+            ),
         ]
 
 
@@ -54,6 +61,6 @@ class EquityPoint(models.Model):
     class Meta:
         ordering = ["timestamp"]
         indexes = [
-            models.Index(fields=["run", "timestamp"]),
+            models.Index(fields=["run", "timestamp"], include=["equity"], name="equity_run_time_cov"),
         ]
     
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+JSON renderer backed by orjson.
+
+Backtest responses carry chart series with one value per bar; orjson encodes
+them in C instead of walking every float through the stdlib encoder.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    # Types orjson does not know natively (lazy strings, Decimal, ...) go
+    # through DRF's own encoder rules
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            default=self.default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
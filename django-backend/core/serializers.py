@@ -1,7 +1,17 @@
 from rest_framework import serializers
 
+# Upper bound on tickers fanned out from a single request
+MAX_TICKERS = 20
+
 class BacktestSerializer(serializers.Serializer):
-    ticker = serializers.CharField(max_length=20)
+    ticker = serializers.CharField(max_length=20, required=False)
+    # Optional: run the same backtest over several tickers in parallel
+    tickers = serializers.ListField(
+        child=serializers.CharField(max_length=20),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_TICKERS,
+    )
     startDate = serializers.DateField()
     endDate = serializers.DateField()
     strategy = serializers.CharField(max_length=100)
@@ -10,8 +20,12 @@ class BacktestSerializer(serializers.Serializer):
 
     def validate(self, attrs):
         """
-        Check that the start date is before the end date.
+        Check that exactly one of ticker/tickers is given and the start date is before the end date.
         """
+        if not attrs.get('ticker') and not attrs.get('tickers'):
+            raise serializers.ValidationError("Provide a ticker or a list of tickers.")
+        if attrs.get('ticker') and attrs.get('tickers'):
+            raise serializers.ValidationError("Provide either ticker or tickers, not both.")
         if attrs['startDate'] >= attrs['endDate']:
             raise serializers.ValidationError("End date must be after start date.")
         return attrs
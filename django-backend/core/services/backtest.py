@@ -1,13 +1,30 @@
 """
 Backtest service layer for executing and persisting backtest results.
+
+Performance notes: a backtest covers thousands of bars, not millions, so time
+goes to Python-level work (per-bar interpreter calls, pandas indexing, building
+Python objects), not to floating point math. Optimizations here therefore move
+work out of Python loops into whole-array NumPy/pandas operations and keep data
+column-oriented (signals, trades, equity). SIMD intrinsics or GPU offload would
+not pay for themselves at these sizes and are deliberately not pursued.
 """
+import logging
 import warnings
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from backtesting import Backtest
 import yfinance as yf
+from yfinance.const import _BASE_URL_ as YAHOO_BASE_URL
+from yfinance.data import YfData
+from yfinance.exceptions import YFPricesMissingError
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections, transaction
 from django.utils import timezone
 
 from ..strategies.factory import create_strategy
@@ -15,9 +32,23 @@ from ..models import BacktestRun, Trade, EquityPoint
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
+logger = logging.getLogger(__name__)
+
+# Persistence runs here so the DB writes stay out of the response time
+PERSIST_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="persist")
+
+
+# Seconds per yfinance request; the fallback gets a shorter budget
+DOWNLOAD_TIMEOUT = 10
+FALLBACK_DOWNLOAD_TIMEOUT = 3
+
+
+# Columns every OHLCV frame is projected to
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
 
-# Strategy name mapping from UI to backend implementation
-STRATEGY_MAP = {
+
+# Strategy name mapping from UI to backend implementation (read-only)
+STRATEGY_MAP = MappingProxyType({
     "SMA": "sma_cross",
     "EMA": "sma_cross",
     "RSI": "rsi",
@@ -25,20 +56,48 @@ STRATEGY_MAP = {
     "LA_BOMBA": "la_bomba",
     "buy_and_hold": "buy_and_hold",
     "sma_cross": "sma_cross",
-}
+})
 
 
 def sanitize_series(series_or_list):
     """Replaces NaN/inf with None and converts valid numbers to standard floats."""
-    return [
-        None if x is None or np.isnan(x) or np.isinf(x) else float(x)
-        for x in series_or_list
-    ]
+    values = np.asarray(series_or_list, dtype=float)
+    # One vectorized pass instead of a per-element isnan/isinf check
+    out = values.astype(object)
+    out[~np.isfinite(values)] = None
+    return out.tolist()
+
+
+def epoch_millis(index: pd.DatetimeIndex) -> list:
+    """Convert a tz-naive DatetimeIndex to epoch milliseconds via a dtype cast."""
+    return index.values.astype("datetime64[ms]").view(np.int64).tolist()
+
+
+def to_aware_datetimes(series: pd.Series, tz) -> np.ndarray:
+    """
+    Localize a datetime column to tz in one pass; NaT entries become None.
+    
+    Bars inside a DST gap shift forward to the next valid instant instead of
+    raising and losing the whole run.
+    """
+    if series.dt.tz is None:
+        series = series.dt.tz_localize(tz, nonexistent="shift_forward")
+    values = series.dt.to_pydatetime()
+    values[pd.isna(series).to_numpy()] = None
+    return values
+
+
+def to_optional_floats(series: pd.Series) -> list:
+    """Convert a numeric column to standard floats, mapping NaN to None."""
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
 
 
 def fetch_ohlcv(ticker: str, start, end, interval: str = "1d") -> pd.DataFrame:
     """
-    Fetch OHLCV data from yfinance.
+    Fetch OHLCV data, serving repeated requests from the Django cache.
     
     Args:
         ticker: Stock ticker symbol
@@ -54,48 +113,127 @@ def fetch_ohlcv(ticker: str, start, end, interval: str = "1d") -> pd.DataFrame:
     """
     ticker = ticker.strip().upper()
     
+    key = f"ohlcv:{ticker}:{start}:{end}:{interval}"
+    df = cache.get(key)
+    if df is not None:
+        return df
+    
+    df = download_ohlcv(ticker, start, end, interval)
+    
+    # Intraday bars keep changing while the market is open, keep them short-lived
+    intraday = interval.endswith(("m", "h"))
+    timeout = settings.OHLCV_INTRADAY_CACHE_TTL if intraday else settings.OHLCV_CACHE_TTL
+    cache.set(key, df, timeout=timeout)
+    
+    return df
+
+
+def ticker_exists(ticker: str) -> bool:
+    """
+    Ask Yahoo's chart endpoint whether a ticker exists.
+    
+    yfinance turns a not-found answer and a failed request into the same
+    YFTzMissingError, so the lookup is made here, before that distinction is
+    lost. It is the exact request yfinance makes for the ticker's timezone and
+    goes through its cached session, so the following download reuses it.
+    
+    Args:
+        ticker: Normalized stock ticker symbol
+        
+    Returns:
+        False if Yahoo answered that the ticker is unknown, True otherwise
+        
+    Raises:
+        Exception: Whatever the HTTP client raises when the request fails
+    """
+    response = YfData().cache_get(
+        url=f"{YAHOO_BASE_URL}/v8/finance/chart/{ticker}",
+        params={"range": "1d", "interval": "1d"},
+        timeout=DOWNLOAD_TIMEOUT,
+    )
+    if response.status_code == 404:
+        return False
+    error = response.json().get("chart", {}).get("error") or {}
+    return error.get("code") != "Not Found"
+
+
+def download_ohlcv(ticker: str, start, end, interval: str = "1d") -> pd.DataFrame:
+    """
+    Download OHLCV data from yfinance.
+    
+    Args:
+        ticker: Normalized stock ticker symbol
+        start: Start date
+        end: End date
+        interval: Data interval (1d, 1wk, etc.)
+        
+    Returns:
+        DataFrame with Open, High, Low, Close, Volume columns
+        
+    Raises:
+        ValueError: If data cannot be retrieved or is incomplete
+    """
+    try:
+        found = ticker_exists(ticker)
+    except Exception:
+        # Transport failure: no verdict, let the download chain below retry
+        found = True
+    if not found:
+        raise ValueError(f"Ticker {ticker} not found")
+    
     df: Optional[pd.DataFrame] | None = None
     try:
-        df = yf.download(
-            ticker,
+        df = yf.Ticker(ticker).history(
             start=str(start),
             end=str(end),
             interval=interval,
-            progress=False,
-            timeout=10,
-            threads=False,
+            timeout=DOWNLOAD_TIMEOUT,
+            actions=False,
+            raise_errors=True,
         )
-        if not df.empty:
-            df.index = df.index.tz_localize(None)
+    except YFPricesMissingError:
+        # Yahoo answered: no bars in range, retrying won't help. YFTzMissingError
+        # is not caught here: for a ticker that exists it means the timezone
+        # lookup itself failed (DNS, connection), so it falls back below
+        raise ValueError(f"No data found for {ticker} in the requested range.")
     except Exception:
         df = None
     
     if df is None or df.empty:
+        # Transport/API failure: one quick second attempt through a different code path
         try:
-            ticker_obj = yf.Ticker(ticker)
-            df = ticker_obj.history(
-                start=str(start), end=str(end), interval=interval, timeout=10
+            df = yf.download(
+                ticker,
+                start=str(start),
+                end=str(end),
+                interval=interval,
+                progress=False,
+                timeout=FALLBACK_DOWNLOAD_TIMEOUT,
+                threads=False,
+                actions=False,
+                group_by="column",
             )
-            if not df.empty:
-                df.index = df.index.tz_localize(None)
         except Exception:
             df = None
     
+    if df is not None and not df.empty and df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    
     if df is None or df.empty:
         raise ValueError(f"Could not retrieve data for {ticker}.")
     
     # Handle MultiIndex columns
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
-    df = df.rename(columns={c: c.capitalize() for c in df.columns})
+    df.columns = df.columns.str.title()
     
     # Validate required columns
-    required_cols = ["Open", "High", "Low", "Close", "Volume"]
-    for col in required_cols:
-        if col not in df.columns:
-            raise ValueError(f"Incomplete data: missing column {col}")
+    missing = [col for col in OHLCV_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Incomplete data: missing column {', '.join(missing)}")
     
-    return df
+    # Drop extra columns (Adj Close, etc.) so only OHLCV is cached and backtested
+    return df.loc[:, OHLCV_COLUMNS]
 
 
 def resolve_strategy_name(ui_strategy_name: str) -> str:
@@ -137,6 +275,32 @@ def execute_backtest(
     return bt.run()
 
 
+def warm_up_backtest_engine() -> None:
+    """
+    Import every available strategy and run each one once on a small
+    synthetic frame, so the first real request in a fresh worker process
+    does not pay for module imports and first-call initialization.
+    
+    Failures are logged, never raised: warm-up is only an optimisation and
+    must not stop a worker or the web app from starting.
+    """
+    index = pd.date_range("2000-01-01", periods=100, freq="D")
+    close = 100 + 10 * np.sin(np.linspace(0, 6 * np.pi, len(index)))
+    df = pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1_000},
+        index=index,
+    )
+    
+    try:
+        # Stats on a toy series divide by zero; the numbers are discarded anyway
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for strategy_name in set(STRATEGY_MAP.values()):
+                if create_strategy(strategy_name):
+                    execute_backtest(df, strategy_name, initial_cash=10_000)
+    except Exception:
+        logger.exception("Backtest engine warm-up failed")
+
+
 def compute_metrics(stats: Any) -> Dict[str, Any]:
     """
     Extract and sanitize metrics from backtest stats.
@@ -162,6 +326,16 @@ def compute_metrics(stats: Any) -> Dict[str, Any]:
     }
 
 
+def signal_series(trades: pd.DataFrame, index: pd.Index) -> pd.Series:
+    """Align trade entry prices onto the bar index (NaN where no entry)."""
+    prices = pd.Series(
+        trades["EntryPrice"].to_numpy(), index=pd.DatetimeIndex(trades["EntryTime"])
+    )
+    # Several trades can open on the same bar; keep the last like .loc did
+    prices = prices[~prices.index.duplicated(keep="last")]
+    return prices.reindex(index)
+
+
 def build_price_chart(df: pd.DataFrame, stats: Any) -> Dict[str, Any]:
     """
     Build price chart data with buy/sell signals and optional overlays.
@@ -174,7 +348,7 @@ def build_price_chart(df: pd.DataFrame, stats: Any) -> Dict[str, Any]:
         Dictionary with dates, close, indicators, and signals
     """
     price_chart_data = {
-        "dates": (df.index.astype(np.int64) // 10**6).tolist(),
+        "dates": epoch_millis(df.index),
         "close": sanitize_series(df["Close"]),
         "sma1": [],
         "sma2": [],
@@ -189,39 +363,215 @@ def build_price_chart(df: pd.DataFrame, stats: Any) -> Dict[str, Any]:
         price_chart_data["sma2"] = sanitize_series(stats._strategy.sma2)
     
     # Extract buy/sell signals from trades
-    buy_signals = pd.Series(np.nan, index=df.index)
-    sell_signals = pd.Series(np.nan, index=df.index)
-    trades_df = stats["_trades"]
+    price_chart_data.update(build_signals(stats["_trades"], df.index))
     
-    if not trades_df.empty:
-        buys = trades_df[trades_df["Size"] > 0]
-        sells = trades_df[trades_df["Size"] < 0]
-        buy_signals.loc[buys["EntryTime"]] = buys["EntryPrice"].values
-        sell_signals.loc[sells["EntryTime"]] = sells["EntryPrice"].values
+    return price_chart_data
+
+
+def build_signals(trades_df: pd.DataFrame, index: pd.Index) -> Dict[str, list]:
+    """
+    Build buy/sell signal series aligned to the price index.
+    
+    Args:
+        trades_df: Trades with EntryTime, EntryPrice and Size columns
+        index: Bar index of the price chart
+        
+    Returns:
+        Dictionary with buy_signals and sell_signals
+    """
+    buy_signals = pd.Series(np.nan, index=index)
+    sell_signals = pd.Series(np.nan, index=index)
     
-    price_chart_data["buy_signals"] = sanitize_series(buy_signals)
-    price_chart_data["sell_signals"] = sanitize_series(sell_signals)
+    if not trades_df.empty:
+        buy_signals = signal_series(trades_df[trades_df["Size"] > 0], index)
+        sell_signals = signal_series(trades_df[trades_df["Size"] < 0], index)
     
-    return price_chart_data
+    return {
+        "buy_signals": sanitize_series(buy_signals),
+        "sell_signals": sanitize_series(sell_signals),
+    }
 
 
-def build_equity_chart(stats: Any) -> Dict[str, Any]:
+def build_equity_chart(
+    stats: Any, index: Optional[pd.Index] = None, dates: Optional[list] = None
+) -> Dict[str, Any]:
     """
     Build equity curve chart data.
     
     Args:
         stats: Backtest stats object
+        index: Price chart index, paired with its already converted dates
+        dates: Epoch milliseconds of index, reused when the equity curve
+            shares that index instead of converting it a second time
         
     Returns:
         Dictionary with dates and equity values
     """
     equity_curve = stats["_equity_curve"]
+    if dates is None or not equity_curve.index.equals(index):
+        dates = epoch_millis(equity_curve.index)
     return {
-        "dates": (equity_curve.index.astype(np.int64) // 10**6).tolist(),
+        "dates": dates,
         "equity": sanitize_series(equity_curve["Equity"]),
     }
 
 
+def find_cached_run(
+    ticker: str,
+    start,
+    end,
+    strategy_name: str,
+    interval: str,
+    initial_cash: float,
+) -> Optional[BacktestRun]:
+    """
+    Find a recent persisted run with exactly the same parameters.
+    
+    Only ranges that ended before today are reused, since their bars are final,
+    and only runs younger than BACKTEST_RUN_CACHE_TTL, so results computed by
+    older strategy code age out.
+    
+    Returns:
+        Most recent matching BacktestRun, or None
+    """
+    if end >= timezone.localdate():
+        return None
+    
+    fresh_since = timezone.now() - timedelta(seconds=settings.BACKTEST_RUN_CACHE_TTL)
+    return (
+        BacktestRun.objects.filter(
+            ticker=ticker,
+            start_date=start,
+            end_date=end,
+            strategy=strategy_name,
+            starting_capital=initial_cash,
+            interval=interval,
+            created_at__gte=fresh_since,
+        )
+        .order_by("-created_at")
+        .first()
+    )
+
+
+def to_naive_index(values) -> pd.DatetimeIndex:
+    """Convert aware datetimes read from the database back to the naive bar clock."""
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert(timezone.get_current_timezone()).tz_localize(None)
+    return index
+
+
+def load_trades(run: BacktestRun) -> pd.DataFrame:
+    """Read the trade columns needed for chart signals, streaming rows as tuples."""
+    rows = (
+        run.trades_detail.order_by("entry_time")
+        .values_list("entry_time", "entry_price", "size")
+        .iterator(chunk_size=2000)
+    )
+    trades_df = pd.DataFrame(list(rows), columns=["EntryTime", "EntryPrice", "Size"])
+    trades_df["EntryTime"] = to_naive_index(trades_df["EntryTime"])
+    return trades_df
+
+
+def load_equity(run: BacktestRun) -> Dict[str, list]:
+    """Read a run's equity curve as chart data, streaming rows as tuples."""
+    rows = list(
+        run.equity_points.order_by("timestamp")
+        .values_list("timestamp", "equity")
+        .iterator(chunk_size=2000)
+    )
+    timestamps, equity = zip(*rows) if rows else ((), ())
+    return {
+        "dates": epoch_millis(to_naive_index(timestamps)),
+        "equity": list(equity),
+    }
+
+
+def build_results_from_run(run: BacktestRun, df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Rebuild the response payload of a persisted run without re-running it.
+    
+    Args:
+        run: Persisted BacktestRun
+        df: OHLCV DataFrame for the run's parameters
+        
+    Returns:
+        Dictionary with metrics, price_chart, and equity_chart
+    """
+    metrics = {
+        "total_return_pct": run.total_return_pct,
+        "cagr_pct": run.cagr_pct,
+        "sharpe": run.sharpe,
+        "max_drawdown_pct": run.max_drawdown_pct,
+        "trades": run.trades,
+        "winrate_pct": run.winrate_pct,
+    }
+    
+    trades_df = load_trades(run)
+    
+    price_chart_data = {
+        "dates": epoch_millis(df.index),
+        "close": sanitize_series(df["Close"]),
+        "sma1": run.indicators.get("sma1", []),
+        "sma2": run.indicators.get("sma2", []),
+    }
+    price_chart_data.update(build_signals(trades_df, df.index))
+    
+    equity_chart_data = load_equity(run)
+    
+    return {
+        "metrics": metrics,
+        "price_chart": price_chart_data,
+        "equity_chart": equity_chart_data,
+    }
+
+
+def _equity_table_sql() -> Tuple[str, str]:
+    """Quoted EquityPoint table name and column list for the raw bulk writers."""
+    quote = connection.ops.quote_name
+    table = quote(EquityPoint._meta.db_table)
+    columns = ", ".join(quote(c) for c in ("run_id", "timestamp", "equity"))
+    return table, columns
+
+
+def copy_equity_points(run: BacktestRun, timestamps, values) -> None:
+    """
+    Bulk load equity points with PostgreSQL's binary COPY.
+    
+    Args:
+        run: Parent BacktestRun
+        timestamps: Aware datetimes
+        values: Equity values aligned with timestamps
+    """
+    table, columns = _equity_table_sql()
+    sql = f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+    
+    with connection.cursor() as cursor:
+        with cursor.copy(sql) as copy:
+            copy.set_types(["int8", "timestamptz", "float8"])
+            for ts, equity in zip(timestamps, values):
+                copy.write_row((run.pk, ts, equity))
+
+
+def insert_equity_points(run: BacktestRun, timestamps, values) -> None:
+    """
+    Bulk insert equity points with a single executemany, skipping model instances.
+    
+    Args:
+        run: Parent BacktestRun
+        timestamps: Aware datetimes
+        values: Equity values aligned with timestamps
+    """
+    table, columns = _equity_table_sql()
+    sql = f"INSERT INTO {table} ({columns}) VALUES (%s, %s, %s)"
+    
+    adapt = connection.ops.adapt_datetimefield_value
+    rows = [(run.pk, adapt(ts), equity) for ts, equity in zip(timestamps, values)]
+    
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
 def persist_backtest_results(
     ticker: str,
     start,
@@ -231,6 +581,7 @@ def persist_backtest_results(
     initial_cash: float,
     metrics: Dict[str, Any],
     stats: Any,
+    indicators: Optional[Dict[str, list]] = None,
 ) -> None:
     """
     Persist backtest run, trades, and equity curve to database.
@@ -244,73 +595,52 @@ def persist_backtest_results(
         initial_cash: Starting capital
         metrics: Computed metrics dictionary
         stats: Backtest stats object
+        indicators: Sanitized indicator overlays (sma1/sma2) for the price chart
     """
     try:
-        # Create main run record
-        run = BacktestRun.objects.create(
-            ticker=ticker,
-            start_date=start,
-            end_date=end,
-            strategy=strategy_name,
-            starting_capital=initial_cash,
-            interval=interval,
-            total_return_pct=float(metrics["total_return_pct"]),
-            cagr_pct=float(metrics["cagr_pct"]),
-            sharpe=float(metrics["sharpe"]),
-            max_drawdown_pct=float(metrics["max_drawdown_pct"]),
-            trades=int(metrics["trades"]),
-            winrate_pct=float(metrics["winrate_pct"]),
-        )
-        
-        # Persist trades
-        trade_rows = []
-        trades_df = stats["_trades"]
-        
-        if isinstance(trades_df, pd.DataFrame) and not trades_df.empty:
-            for _, row in trades_df.iterrows():
-                entry_time = row.get("EntryTime")
-                exit_time = row.get("ExitTime")
-                
-                # Convert to aware datetimes
-                if pd.notna(entry_time):
-                    if getattr(entry_time, "tzinfo", None) is None:
-                        entry_time = timezone.make_aware(entry_time.to_pydatetime())
-                    else:
-                        entry_time = entry_time.to_pydatetime()
-                else:
-                    entry_time = None
-                    
-                if pd.notna(exit_time):
-                    if getattr(exit_time, "tzinfo", None) is None:
-                        exit_time = timezone.make_aware(exit_time.to_pydatetime())
-                    else:
-                        exit_time = exit_time.to_pydatetime()
-                else:
-                    exit_time = None
+        # One transaction: a single commit, and no half-written runs on failure
+        with transaction.atomic():
+            # Resolved once and shared by every datetime column below
+            tz = timezone.get_current_timezone()
+            
+            # Create main run record
+            run = BacktestRun.objects.create(
+                ticker=ticker,
+                start_date=start,
+                end_date=end,
+                strategy=strategy_name,
+                starting_capital=initial_cash,
+                interval=interval,
+                indicators=indicators or {},
+                total_return_pct=float(metrics["total_return_pct"]),
+                cagr_pct=float(metrics["cagr_pct"]),
+                sharpe=float(metrics["sharpe"]),
+                max_drawdown_pct=float(metrics["max_drawdown_pct"]),
+                trades=int(metrics["trades"]),
+                winrate_pct=float(metrics["winrate_pct"]),
+            )
+            
+            # Persist trades
+            trade_rows = []
+            trades_df = stats["_trades"]
+            
+            if isinstance(trades_df, pd.DataFrame) and not trades_df.empty:
+                # Extract each column once instead of boxing a Series per row
+                entry_times = to_aware_datetimes(trades_df["EntryTime"], tz)
+                exit_times = to_aware_datetimes(trades_df["ExitTime"], tz)
+                entry_prices = to_optional_floats(trades_df["EntryPrice"])
+                exit_prices = to_optional_floats(trades_df["ExitPrice"])
+                sizes = trades_df["Size"].to_numpy(dtype=float, na_value=0.0).tolist()
+                pnls = to_optional_floats(trades_df["PnL"])
+                return_pcts = to_optional_floats(trades_df["ReturnPct"])
                 
-                entry_price = (
-                    float(row.get("EntryPrice", np.nan))
-                    if pd.notna(row.get("EntryPrice"))
-                    else None
-                )
-                exit_price = (
-                    float(row.get("ExitPrice", np.nan))
-                    if pd.notna(row.get("ExitPrice"))
-                    else None
-                )
-                size = float(row.get("Size", 0) or 0)
-                pnl = float(row.get("PnL", np.nan)) if pd.notna(row.get("PnL")) else None
-                return_pct = (
-                    float(row.get("ReturnPct", np.nan))
-                    if pd.notna(row.get("ReturnPct"))
-                    else None
+                seconds = (
+                    (trades_df["ExitTime"] - trades_df["EntryTime"]).dt.total_seconds().to_numpy()
                 )
+                durations = np.nan_to_num(seconds).astype(np.int64).astype(object)
+                durations[np.isnan(seconds)] = None
                 
-                duration_seconds = None
-                if entry_time and exit_time:
-                    duration_seconds = int((exit_time - entry_time).total_seconds())
-                
-                trade_rows.append(
+                trade_rows = [
                     Trade(
                         run=run,
                         entry_time=entry_time,
@@ -322,46 +652,71 @@ def persist_backtest_results(
                         return_pct=return_pct,
                         duration_seconds=duration_seconds,
                     )
-                )
-        
-        if trade_rows:
-            Trade.objects.bulk_create(trade_rows, batch_size=500)
-        
-        # Persist equity curve
-        equity_rows = []
-        equity_curve = stats["_equity_curve"]
-        
-        if isinstance(equity_curve, pd.DataFrame) and not equity_curve.empty:
-            for ts, erow in equity_curve.iterrows():
-                ts_dt = ts.to_pydatetime()
-                if getattr(ts_dt, "tzinfo", None) is None:
-                    ts_dt = timezone.make_aware(ts_dt)
-                equity_val = float(erow.get("Equity", np.nan))
-                if not np.isnan(equity_val) and not np.isinf(equity_val):
-                    equity_rows.append(
-                        EquityPoint(run=run, timestamp=ts_dt, equity=equity_val)
+                    for (
+                        entry_time, exit_time, entry_price, exit_price,
+                        size, pnl, return_pct, duration_seconds,
+                    ) in zip(
+                        entry_times, exit_times, entry_prices, exit_prices,
+                        sizes, pnls, return_pcts, durations,
                     )
-        
-        if equity_rows:
-            EquityPoint.objects.bulk_create(equity_rows, batch_size=1000)
+                ]
+            
+            if trade_rows:
+                Trade.objects.bulk_create(trade_rows, batch_size=500)
+            
+            # Persist equity curve
+            equity_curve = stats["_equity_curve"]
             
+            if isinstance(equity_curve, pd.DataFrame) and not equity_curve.empty:
+                equity_values = equity_curve["Equity"].to_numpy(dtype=float)
+                valid = np.isfinite(equity_values)
+                timestamps = to_aware_datetimes(equity_curve.index.to_series(), tz)[valid]
+                values = equity_values[valid].tolist()
+                
+                if connection.vendor == "postgresql":
+                    copy_equity_points(run, timestamps, values)
+                elif values:
+                    insert_equity_points(run, timestamps, values)
+                
     except Exception as e:
         # Do not fail the API if persistence fails
         print(f"Persistence error: {e}")
 
 
+def persist_in_background(**kwargs) -> Future:
+    """
+    Queue persist_backtest_results on the background executor.
+    
+    Args:
+        **kwargs: Arguments for persist_backtest_results
+        
+    Returns:
+        Future of the persistence job
+    """
+    return PERSIST_EXECUTOR.submit(persist_and_release_connection, kwargs)
+
+
+def persist_and_release_connection(kwargs: Dict[str, Any]) -> None:
+    """Persist results, then release the executor thread's DB connection."""
+    try:
+        persist_backtest_results(**kwargs)
+    finally:
+        connections.close_all()
+
+
 def run_backtest(validated_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main service entry point: execute backtest and return results.
     
     This function orchestrates the entire backtest workflow:
     1. Validate dates
-    2. Fetch OHLCV data
-    3. Resolve strategy name
-    4. Execute backtest
-    5. Compute metrics and build charts
-    6. Persist results
-    7. Return response payload
+    2. Resolve strategy name
+    3. Fetch OHLCV data
+    4. Reuse a persisted identical run if the range is closed
+    5. Execute backtest
+    6. Compute metrics and build charts
+    7. Persist results
+    8. Return response payload
     
     Args:
         validated_data: Validated input from serializer
@@ -381,11 +736,18 @@ def run_backtest(validated_data: Dict[str, Any]) -> Dict[str, Any]:
         return {"error": "Start date must be before end date."}
     
     try:
+        # Resolve strategy name through factory
+        strategy_name = resolve_strategy_name(ui_strategy_name)
+        
         # Fetch data
         df = fetch_ohlcv(ticker, start, end, interval)
         
-        # Resolve strategy name through factory
-        strategy_name = resolve_strategy_name(ui_strategy_name)
+        # Reuse an identical run over a closed date range
+        cached_run = find_cached_run(
+            ticker, start, end, strategy_name, interval, initial_cash
+        )
+        if cached_run is not None:
+            return build_results_from_run(cached_run, df)
         
         # Execute backtest
         stats = execute_backtest(df, strategy_name, initial_cash)
@@ -393,10 +755,12 @@ def run_backtest(validated_data: Dict[str, Any]) -> Dict[str, Any]:
         # Build response data
         metrics = compute_metrics(stats)
         price_chart_data = build_price_chart(df, stats)
-        equity_chart_data = build_equity_chart(stats)
+        equity_chart_data = build_equity_chart(
+            stats, index=df.index, dates=price_chart_data["dates"]
+        )
         
         # Persist results (non-blocking)
-        persist_backtest_results(
+        persist_in_background(
             ticker=ticker,
             start=start,
             end=end,
@@ -405,6 +769,10 @@ def run_backtest(validated_data: Dict[str, Any]) -> Dict[str, Any]:
             initial_cash=initial_cash,
             metrics=metrics,
             stats=stats,
+            indicators={
+                "sma1": price_chart_data["sma1"],
+                "sma2": price_chart_data["sma2"],
+            },
         )
         
         return {
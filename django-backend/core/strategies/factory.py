@@ -1,9 +1,16 @@
 import importlib
+from functools import lru_cache
 
+
+@lru_cache(maxsize=32)
 def create_strategy(strategy_name: str):
     """
     Factory function to dynamically load and return a strategy class.
- """
+
+    Results are memoized: strategy modules are imported once per process,
+    and unknown names resolve to None. The cache is bounded because names
+    come straight from API requests.
+    """
     try:
         # Convention: strategy file is in core.strategies.<strategy_name>
         # nos da el path por ejemplo de core.strategies.la_bomba
@@ -26,4 +33,5 @@ def create_strategy(strategy_name: str):
         return strategy_class
 
     except (ImportError, AttributeError):
-        print(f"Error la estrategia: {strategy_name} no esta implementada")
+        # la estrategia no esta implementada, execute_backtest reporta el error
+        return None
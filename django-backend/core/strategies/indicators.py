@@ -0,0 +1,27 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def sma(values, n):
+    """
+    Simple moving average over a fixed window, computed on the raw array
+    instead of going through pandas' rolling engine. The first n-1 bars, and
+    any window containing a NaN, are NaN, as with `rolling(n).mean()`.
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(len(values), np.nan)
+    if len(values) >= n:
+        out[n - 1:] = sliding_window_view(values, n).mean(axis=1)
+    return out
+
+
+def cross_above(series1, series2):
+    """
+    Vectorized `backtesting.lib.crossover`: True on each bar where series1
+    closes above series2 after being below it on the previous bar.
+    """
+    series1 = np.asarray(series1, dtype=float)
+    series2 = np.asarray(series2, dtype=float)
+    crossed = np.zeros(len(series1), dtype=bool)
+    crossed[1:] = (series1[:-1] < series2[:-1]) & (series1[1:] > series2[1:])
+    return crossed
@@ -1,6 +1,6 @@
 from backtesting import Strategy
-from backtesting.lib import crossover
-from backtesting.test import SMA
+
+from .indicators import cross_above, sma
 
 class LaBomba(Strategy):
     """
@@ -20,8 +20,11 @@ class LaBomba(Strategy):
 
     def init(self):
         """Inicializa los indicadores."""
-        self.sma1 = self.I(SMA, self.data.Close, self.n1)
-        self.sma2 = self.I(SMA, self.data.Close, self.n2)
+        self.sma1 = self.I(sma, self.data.Close, self.n1)
+        self.sma2 = self.I(sma, self.data.Close, self.n2)
+        # Señales de cruce calculadas de una vez sobre toda la serie
+        self.cross_up = self.I(cross_above, self.sma1, self.sma2, plot=False)
+        self.cross_down = self.I(cross_above, self.sma2, self.sma1, plot=False)
 
     def next(self):
         """Define la lógica de la estrategia para cada vela."""
@@ -47,13 +50,13 @@ class LaBomba(Strategy):
         # Si no hay una posición abierta, busca señales de cruce.
         if not self.position:
             # Señal de Compra: SMA1 cruza por encima de SMA2
-            if crossover(self.sma1, self.sma2):
+            if self.cross_up[-1]:
                 sl = price * (1 - self.stop_loss_pct)
                 tp = price * (1 + self.take_profit_pct)
                 self.buy(sl=sl, tp=tp)
 
             # Señal de Venta Corta: SMA2 cruza por encima de SMA1
-            elif crossover(self.sma2, self.sma1):
+            elif self.cross_down[-1]:
                 sl = price * (1 + self.stop_loss_pct)
                 tp = price * (1 - self.take_profit_pct)
                 self.sell(sl=sl, tp=tp)
@@ -1,17 +1,20 @@
 from backtesting import Strategy
-from backtesting.lib import crossover
-from backtesting.test import SMA
+
+from .indicators import cross_above, sma
 
 class SmaCross(Strategy):
     n1 = 10 
     n2 = 50
 
     def init(self):
-        self.sma1 = self.I(SMA, self.data.Close, self.n1)
-        self.sma2 = self.I(SMA, self.data.Close, self.n2)
+        self.sma1 = self.I(sma, self.data.Close, self.n1)
+        self.sma2 = self.I(sma, self.data.Close, self.n2)
+        # Cross signals precomputed over the whole series
+        self.cross_up = self.I(cross_above, self.sma1, self.sma2, plot=False)
+        self.cross_down = self.I(cross_above, self.sma2, self.sma1, plot=False)
 
     def next(self):
-        if crossover(self.sma1, self.sma2):
+        if self.cross_up[-1]:
             self.buy()
-        elif crossover(self.sma2, self.sma1):
+        elif self.cross_down[-1]:
             self.sell()
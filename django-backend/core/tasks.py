@@ -0,0 +1,44 @@
+"""
+Celery tasks that run backtests off the request thread.
+"""
+from typing import Any, Dict
+
+from celery import shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from .serializers import BacktestSerializer
+from .services.backtest import PERSIST_EXECUTOR, run_backtest, warm_up_backtest_engine
+
+
+@worker_process_init.connect
+def warm_worker_process(**kwargs) -> None:
+    """Prime strategy imports and the backtest engine in each new worker process."""
+    warm_up_backtest_engine()
+
+
+@worker_process_shutdown.connect
+def drain_persistence(**kwargs) -> None:
+    """
+    Finish queued and running persistence jobs before a worker process exits.
+    
+    Pool children leave through os._exit, which skips the interpreter's usual
+    wait on executor threads; without this, pending writes would be dropped.
+    """
+    PERSIST_EXECUTOR.shutdown(wait=True)
+
+
+@shared_task
+def run_backtest_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute a backtest in a worker.
+    
+    Args:
+        payload: Serialized backtest request (JSON-safe, dates as ISO strings)
+        
+    Returns:
+        Result dictionary from run_backtest (metrics and charts, or error)
+    """
+    serializer = BacktestSerializer(data=payload)
+    if not serializer.is_valid():
+        return {"error": serializer.errors}
+    return run_backtest(serializer.validated_data)
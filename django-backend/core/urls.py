@@ -3,5 +3,6 @@ from . import views
 
 urlpatterns = [
     path('api/v1/backtest/', views.BacktestAPIView.as_view(), name='api_backtest'),
+    path('api/v1/backtest/jobs/<str:job_id>/', views.BacktestJobView.as_view(), name='api_backtest_job'),
     path('api/v1/healthcheck/', views.HealthCheckView.as_view(), name='healthcheck'),
 ]
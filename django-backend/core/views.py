@@ -1,25 +1,15 @@
-import warnings
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-import numpy as np
-import pandas as pd
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
 
 from .serializers import BacktestSerializer
-from .services.backtest import run_backtest
-
-warnings.simplefilter(action="ignore", category=FutureWarning)
-
-
-def sanitize_series(series_or_list):
-    """Replaces NaN/inf with None and converts valid numbers to standard floats."""
-    return [
-        None if x is None or np.isnan(x) or np.isinf(x) else float(x)
-        for x in series_or_list
-    ]
+from .tasks import run_backtest_task
 
 
 class HealthCheckView(APIView):
@@ -27,21 +17,105 @@ class HealthCheckView(APIView):
         return JsonResponse({'status': 'ok'})
 
 
+def job_cache_key(job_id: str) -> str:
+    """Cache key marking a job id issued by this API."""
+    return f"backtest-job:{job_id}"
+
+
+def queue_backtest(payload: Dict[str, Any]) -> AsyncResult:
+    """
+    Queue a backtest and remember its id for as long as its result is kept.
+
+    Celery reports unknown and expired ids as PENDING, just like queued ones;
+    the marker lets `BacktestJobView` answer 404 for ids it never issued.
+    """
+    task = run_backtest_task.delay(payload)
+    cache.set(job_cache_key(task.id), True, timeout=settings.CELERY_RESULT_EXPIRES)
+    return task
+
+
+def backtest_result_response(results: Dict[str, Any]) -> Response:
+    """Map a finished backtest result to a response with the right status code."""
+    if "error" in results:
+        return Response(results, status=status.HTTP_400_BAD_REQUEST)
+    return Response(results, status=status.HTTP_200_OK)
+
+
 class BacktestAPIView(APIView):
     """
     API view to handle backtesting requests from the frontend.
+
+    The backtest is queued on a Celery worker and a job id is returned right
+    away; clients poll `BacktestJobView` for the result. When tasks run
+    eagerly (no broker configured) the result is returned directly.
+
+    A `tickers` list queues one job per ticker, so the worker pool runs them
+    in parallel; the response maps each ticker to its job id (or result).
+    Tickers succeed or fail independently: a failed ticker's entry is its
+    own `{"error": ...}` payload, and the response status stays 200/202.
     """
 
     def post(self, request, *args, **kwargs):
         serializer = BacktestSerializer(data=request.data)
         if serializer.is_valid():
-            # Call the service layer
-            results: Dict[str, Any] = run_backtest(serializer.validated_data)
+            payload = serializer.data
+            tickers = payload.pop("tickers", None)
+            if tickers:
+                return self.queue_many(payload, tickers)
 
-            # Check if the service returned an error
-            if "error" in results:
-                return Response(results, status=status.HTTP_400_BAD_REQUEST)
+            # Hand the work to the task queue
+            task = queue_backtest(payload)
 
-            return Response(results, status=status.HTTP_200_OK)
+            if task.ready():
+                return backtest_result_response(task.result)
+
+            return Response({"job_id": task.id}, status=status.HTTP_202_ACCEPTED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def queue_many(self, payload: Dict[str, Any], tickers: List[str]) -> Response:
+        """Queue one backtest per distinct ticker with otherwise identical parameters."""
+        tasks = {
+            ticker: queue_backtest({**payload, "ticker": ticker})
+            for ticker in dict.fromkeys(t.strip().upper() for t in tickers)
+        }
+
+        if all(task.ready() for task in tasks.values()):
+            return Response(
+                {"results": {ticker: task.result for ticker, task in tasks.items()}},
+                status=status.HTTP_200_OK,
+            )
+
+        return Response(
+            {"jobs": {ticker: task.id for ticker, task in tasks.items()}},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class BacktestJobView(APIView):
+    """
+    API view to poll the state of a queued backtest.
+    """
+
+    def get(self, request, job_id, *args, **kwargs):
+        result = AsyncResult(job_id)
+
+        if not result.ready() and not cache.get(job_cache_key(job_id)):
+            return Response(
+                {"error": "Unknown or expired job."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if not result.ready():
+            return Response(
+                {"job_id": job_id, "status": result.state.lower()},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        if result.failed():
+            return Response(
+                {"error": "An unexpected error occurred during backtest execution."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return backtest_result_response(result.result)
@@ -42,6 +42,10 @@ const getApiBaseUrl = () => {
   return 'http://localhost:8000';
 };
 
+// How often to poll a queued backtest job, and for how long before giving up
+const JOB_POLL_INTERVAL_MS = 1000;
+const JOB_POLL_MAX_ATTEMPTS = 300;
+
 // Define strategy options
 const strategyOptions = [
   { value: 'SMA', label: 'Simple Moving Average' },
@@ -105,7 +109,7 @@ function App() {
       const csrftoken = getCookie('csrftoken');
 
       console.log('Using API URL:', apiUrl);
-      const response = await fetch(apiUrl, {
+      let response = await fetch(apiUrl, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -114,7 +118,27 @@ function App() {
         body: JSON.stringify(backtestParams),
       });
 
-      const data = await response.json();
+      let data = await response.json();
+
+      // The backtest was queued on a worker: poll the job until it finishes
+      if (response.status === 202) {
+        const jobUrl = `${apiBaseUrl}/api/v1/backtest/jobs/${data.job_id}/`;
+        let jobResponse = response;
+        let attempts = 0;
+        while (jobResponse.status === 202) {
+          if (attempts >= JOB_POLL_MAX_ATTEMPTS) {
+            throw new Error('The backtest did not finish in time. Please try again later.');
+          }
+          attempts += 1;
+          await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+          jobResponse = await fetch(jobUrl);
+          if (!(jobResponse.headers.get('Content-Type') || '').includes('application/json')) {
+            throw new Error(`Unexpected response (${jobResponse.status}) while waiting for the backtest.`);
+          }
+          data = await jobResponse.json();
+        }
+        response = jobResponse;
+      }
       console.log('API Response:', data);
 
       if (!response.ok) {